@@ -5,8 +5,17 @@ from pathlib import Path
 
 # This is a tool for scraping game art for retro games using the screenscraper api.
 
+# Results of a successful load and connection check, reused for the rest of
+# the process. Failures are not kept, so a later call tries again.
+_credentials = None
+_connected_credentials = None
+
 def load_credentials():
-    """Load ScreenScraper API credentials from config file."""
+    """Load ScreenScraper API credentials from config file (kept once loaded successfully)."""
+    global _credentials
+    if _credentials is not None:
+        return _credentials
+    
     config_file = Path(__file__).parent / 'config.json'
     
     if not config_file.exists():
@@ -28,10 +37,15 @@ def load_credentials():
     with open(config_file, 'r') as f:
         config = json.load(f)
     
-    return config['screenscraper']
+    _credentials = config['screenscraper']
+    return _credentials
 
 def connect_to_screenscraper():
-    """Connect to ScreenScraper API with stored credentials."""
+    """Connect to ScreenScraper API with stored credentials (kept once the check succeeds)."""
+    global _connected_credentials
+    if _connected_credentials is not None:
+        return _connected_credentials
+    
     creds = load_credentials()
     if not creds:
         return None
@@ -53,6 +67,7 @@ def connect_to_screenscraper():
     try:
         response = requests.get(test_url, params=params)
         response.raise_for_status()
+        _connected_credentials = creds
         return creds
     except requests.RequestException as e:
         print(f"Failed to connect to ScreenScraper: {e}")
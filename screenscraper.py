@@ -9,21 +9,226 @@ Author: Assistant
 License: MIT
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
+import shutil
 import time
 import json
+import mmap
+import os
+import pickle
+import re
+import sqlite3
+import threading
 import xml.etree.ElementTree as ET
 import zlib
-from typing import Dict, List, Optional, Union, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
+from urllib.parse import urlencode
 import logging
 
+try:
+    import aiohttp
+    import aiofiles
+except ImportError:  # async support is optional
+    aiohttp = None
+    aiofiles = None
+
+try:
+    import uvloop
+except ImportError:  # faster event loop for the async client is optional
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # faster JSON parsing is optional
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # streaming parser for very large responses is optional
+    ijson = None
+
+# Both accept bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# ScreenScraper sometimes emits a trailing comma before a closing brace
+_MALFORMED_JSON = b'],\n\t\t}'
+_MALFORMED_JSON_FIX = b']\n\t\t}'
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Files at least this large are hashed with MD5, SHA1 and CRC32 running in parallel
+PARALLEL_HASH_MIN_SIZE = 8 * 1024 * 1024
+
+# Characters stripped from game names when building media filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]+')
+
+# Responses larger than this are parsed incrementally when ijson is installed
+STREAM_PARSE_MIN_SIZE = 512 * 1024
+
+# Set on incrementally parsed responses, which only hold the STREAMED_FIELDS
+_PRUNED_KEY = '_pruned'
+
+# Plain-HTTP downloads at least this large are spliced from the socket to disk on Linux
+SPLICE_MIN_SIZE = 4 * 1024 * 1024
+
+
+def _new_session() -> requests.Session:
+    """Create a requests session with a connection pool sized for parallel downloads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared by GameMedia.download calls made without a client session, so that
+# repeated downloads reuse kept-alive connections instead of new TLS handshakes
+_DEFAULT_SESSION = _new_session()
+
+
+def _splice_to_file(response: requests.Response, f) -> bool:
+    """
+    Move a response body from the socket into a file with os.splice.
+    
+    The bytes go socket -> pipe -> file inside the kernel instead of being
+    copied through Python buffers. This only applies on Linux to large,
+    fixed-length, unencoded bodies received over a blocking plaintext socket.
+    Otherwise it returns False without reading anything, and the caller
+    should copy the body normally.
+    """
+    if not hasattr(os, 'splice') or not response.url.startswith('http://'):
+        return False
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return False
+    
+    try:
+        http_response = response.raw._fp
+        reader = http_response.fp
+        sock = reader.raw._sock
+    except AttributeError:
+        return False
+    
+    remaining = http_response.length
+    if (http_response.chunked or remaining is None or remaining < SPLICE_MIN_SIZE
+            or sock.gettimeout() is not None):
+        return False
+    
+    # http.client may already have buffered the start of the body with the headers
+    head = reader.read1(remaining)
+    f.write(head)
+    f.flush()
+    remaining -= len(head)
+    
+    read_fd, write_fd = os.pipe()
+    try:
+        while remaining:
+            received = os.splice(sock.fileno(), write_fd, min(remaining, 64 * 1024))
+            if not received:
+                raise ConnectionError(f"Connection closed with {remaining} bytes left to read")
+            remaining -= received
+            while received:
+                received -= os.splice(read_fd, f.fileno(), received)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+    
+    # urllib3 never saw the body, so the connection cannot go back to the pool
+    response.close()
+    return True
+
+
+class _JSONFixupReader:
+    """File-like reader over response chunks that repairs ScreenScraper's malformed JSON on the fly."""
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._tail = b''
+    
+    def read(self, size: int = -1) -> bytes:
+        # Chunks are returned whole; a zero-size read is only a type probe
+        if size == 0:
+            return b''
+        
+        for chunk in self._chunks:
+            data = (self._tail + chunk).replace(_MALFORMED_JSON, _MALFORMED_JSON_FIX)
+            # Hold back what could be the start of a match split across chunks
+            keep = len(_MALFORMED_JSON) - 1
+            self._tail = data[-keep:]
+            if len(data) > keep:
+                return data[:-keep]
+        
+        data, self._tail = self._tail, b''
+        return data
+
+
+def _stream_parse_json(reader: _JSONFixupReader, paths: Tuple[str, ...]) -> Dict:
+    """
+    Incrementally parse a JSON document, keeping only the values at the given dotted paths.
+    
+    Everything else is skipped without being built into Python objects.
+    """
+    data = {}
+    builder = None
+    
+    for prefix, event, value in ijson.parse(reader, use_float=True):
+        if builder is None:
+            if prefix not in paths or event == 'map_key':
+                continue
+            builder = ijson.ObjectBuilder()
+            path = prefix
+            depth = 0
+        
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        
+        if depth == 0:
+            *parents, key = path.split('.')
+            node = data
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[key] = builder.value
+            builder = None
+    
+    return data
+
+
+def _iter_file_chunks(file_path: Path) -> Iterator[memoryview]:
+    """
+    Yield the contents of a file as memoryviews for hashing.
+    
+    Normally this is a single view of a read-only mapping, so each hasher makes
+    one C call over the whole file and the data stays in the page cache rather
+    than on the Python heap. Files that cannot be mapped are streamed through
+    one reused buffer instead. This covers empty files and disc images too large
+    for a 32-bit address space.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError):
+            buffer = bytearray(1024 * 1024)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    return
+                yield view[:size]
+        
+        with mm, memoryview(mm) as mv:
+            yield mv
+
 
 @dataclass
 class GameMedia:
@@ -34,18 +239,39 @@ class GameMedia:
     region: str = ""
     size: str = ""
     
-    def download(self, save_path: Union[str, Path]) -> bool:
-        """Download the media file to the specified path."""
+    def download(self, save_path: Union[str, Path], session: Optional[requests.Session] = None) -> bool:
+        """Download the media file to the specified path, reusing the session's connections."""
+        session = session or _DEFAULT_SESSION
         try:
-            response = requests.get(self.url, stream=True)
-            response.raise_for_status()
+            with session.get(self.url, stream=True) as response:
+                response.raise_for_status()
+                
+                save_path = Path(save_path)
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Let urllib3 undo any Content-Encoding, then copy in 1MiB blocks
+                response.raw.decode_content = True
+                with open(save_path, 'wb') as f:
+                    if not _splice_to_file(response, f):
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
+            logger.info(f"Downloaded {self.media_type} to {save_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to download {self.media_type}: {e}")
+            return False
+    
+    async def download_async(self, save_path: Union[str, Path], session: "aiohttp.ClientSession") -> bool:
+        """Download the media file to the specified path using an aiohttp session."""
+        try:
             save_path = Path(save_path)
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            async with session.get(self.url) as response:
+                response.raise_for_status()
+                async with aiofiles.open(save_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(65536):
+                        await f.write(chunk)
             
             logger.info(f"Downloaded {self.media_type} to {save_path}")
             return True
@@ -54,6 +280,10 @@ class GameMedia:
             return False
 
 
+# Region preference used by get_best_media when none is given
+_DEFAULT_REGIONS = ('us', 'wor', 'eu', 'jp')
+
+
 @dataclass
 class GameInfo:
     """Represents comprehensive game information from ScreenScraper."""
@@ -70,24 +300,58 @@ class GameInfo:
     media: List[GameMedia] = field(default_factory=list)
     raw_data: Dict = field(default_factory=dict)
     
+    # Media lookup indices. These are plain class attributes, not fields, so
+    # they stay out of asdict(), repr() and comparisons.
+    _indexed_media = None
+    _indexed_len = 0
+    
+    def _index_media(self):
+        """Index media by type and by (type, lower-cased region), keeping the first match."""
+        # Assigning a new media list or adding and removing items is picked up
+        # here; replacing or reordering items in place needs reindex_media()
+        if self._indexed_media is self.media and self._indexed_len == len(self.media):
+            return
+        self.reindex_media()
+    
+    def reindex_media(self):
+        """Rebuild the media lookup indices after changing items of media in place."""
+        by_type: Dict[str, List[GameMedia]] = {}
+        by_type_region: Dict[str, Dict[str, GameMedia]] = {}
+        for media in self.media:
+            by_type.setdefault(media.media_type, []).append(media)
+            by_type_region.setdefault(media.media_type, {}).setdefault(media.region.lower(), media)
+        
+        self._by_type = by_type
+        self._by_type_region = by_type_region
+        self._indexed_media = self.media
+        self._indexed_len = len(self.media)
+    
     def get_media_by_type(self, media_type: str) -> List[GameMedia]:
         """Get all media items of a specific type (e.g., 'box-2D', 'screenshot')."""
-        return [m for m in self.media if m.media_type == media_type]
+        self._index_media()
+        return list(self._by_type.get(media_type, ()))
     
-    def get_best_media(self, media_type: str, preferred_regions: Optional[List[str]] = None) -> Optional[GameMedia]:
-        """Get the best media item of a type, preferring certain regions."""
+    def get_best_media(self, media_type: str, preferred_regions: Optional[Iterable[str]] = None) -> Optional[GameMedia]:
+        """
+        Get the best media item of a type, preferring certain regions.
+        
+        preferred_regions may be any iterable of region codes, most preferred
+        first.
+        """
         if preferred_regions is None:
-            preferred_regions = ['us', 'wor', 'eu', 'jp']
+            preferred_regions = _DEFAULT_REGIONS
         
-        candidates = self.get_media_by_type(media_type)
+        self._index_media()
+        candidates = self._by_type.get(media_type)
         if not candidates:
             return None
         
         # Try to find media from preferred regions
+        by_region = self._by_type_region[media_type]
         for region in preferred_regions:
-            for media in candidates:
-                if media.region.lower() == region.lower():
-                    return media
+            media = by_region.get(region.lower())
+            if media:
+                return media
         
         # Return first available if no regional preference matches
         return candidates[0]
@@ -113,6 +377,18 @@ class GameNotFoundError(ScreenScraperError):
     pass
 
 
+class APIUnavailableError(ScreenScraperError):
+    """Raised when a request times out, cannot connect, or gets a server error; retrying may succeed."""
+    pass
+
+
+def _request_error(error: Exception, status: Optional[int]) -> ScreenScraperError:
+    """Wrap a failed HTTP request, as APIUnavailableError if it is worth retrying."""
+    if status is None or status >= 500 or status == 429:
+        return APIUnavailableError(f"Request failed: {error}")
+    return ScreenScraperError(f"Request failed: {error}")
+
+
 class ScreenScraperClient:
     """
     Main client for interacting with the ScreenScraper.fr API.
@@ -122,6 +398,33 @@ class ScreenScraperClient:
     
     BASE_URL = "https://www.screenscraper.fr/api2"
     
+    # Maximum number of media files downloaded in parallel per game
+    MAX_DOWNLOAD_WORKERS = 8
+    
+    # Maximum number of name searches run in parallel by search_by_name_many
+    MAX_SEARCH_WORKERS = 4
+    
+    # Response fields used by _check_response and _parse_game_data, the only
+    # ones kept when a large response is parsed incrementally
+    STREAMED_FIELDS = (
+        'header',
+        'response.ssuser',
+        'response.jeu.id',
+        'response.jeu.noms',
+        'response.jeu.synopsis',
+        'response.jeu.editeur',
+        'response.jeu.developpeur',
+        'response.jeu.joueurs',
+        'response.jeu.note',
+        'response.jeu.dates',
+        'response.jeu.genres',
+        'response.jeu.systeme',
+        'response.jeu.medias',
+    )
+    
+    # Passwords are left out of response cache keys, so no secrets reach the cache file
+    CACHE_EXCLUDED_PARAMS = ('devpassword', 'sspassword')
+    
     # Common media types available from ScreenScraper
     MEDIA_TYPES = {
         'box-2D': 'box-2D',           # 2D box art
@@ -169,8 +472,13 @@ class ScreenScraperClient:
                  user_id: Optional[str] = None,
                  user_password: Optional[str] = None,
                  language: str = "en",
-                 max_requests_per_day: int = 10000,
-                 request_delay: float = 1.0):
+                 max_requests_per_day: Optional[int] = None,
+                 request_delay: float = 1.0,
+                 cache_path: Optional[Union[str, Path]] = None,
+                 ttl_seconds: int = 30 * 24 * 60 * 60,
+                 adaptive_rate_limit: bool = True,
+                 store_raw: bool = False,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the ScreenScraper client.
         
@@ -181,8 +489,17 @@ class ScreenScraperClient:
             user_id: Optional user ID for registered users
             user_password: Optional user password
             language: Language preference (en, fr, es, de, etc.)
-            max_requests_per_day: Maximum requests per day (for rate limiting)
+            max_requests_per_day: Optional cap on requests per day, below the
+                account's daily quota (which is always enforced once reported)
             request_delay: Delay between requests in seconds
+            cache_path: Optional SQLite file for caching API responses between runs
+            ttl_seconds: How long cached responses stay valid (default 30 days)
+            adaptive_rate_limit: Once the server reports the account's quota, pace
+                requests by its per-minute allowance instead of request_delay
+            store_raw: Keep the full API response for each game in GameInfo.raw_data
+                (off by default to save memory on large scrapes)
+            session: Optional requests session to use, e.g. one with custom retries
+                or shared with other clients; its User-Agent header is set
         """
         self.dev_id = dev_id
         self.dev_password = dev_password
@@ -192,24 +509,96 @@ class ScreenScraperClient:
         self.language = language
         self.max_requests_per_day = max_requests_per_day
         self.request_delay = request_delay
+        self.store_raw = store_raw
         
-        self.session = requests.Session()
+        self.session = session if session is not None else _new_session()
         self.session.headers.update({
             'User-Agent': f'{software_name}/1.0'
         })
         
         self.request_count = 0
         self.last_request_time = 0
+        
+        # Account limits as reported by the server in response.ssuser
+        self.adaptive_rate_limit = adaptive_rate_limit
+        self.max_threads: Optional[int] = None
+        self.requests_today: Optional[int] = None
+        self.daily_quota: Optional[int] = None  # account quota, or max_requests_per_day if lower
+        self._server_responded = False  # set once any response has come back
+        self._request_times: Optional[deque] = None  # start times within the last minute
+        self._rate_lock = threading.Lock()
+        
+        self.ttl_seconds = ttl_seconds
+        self._cache = None
+        self._cache_lock = threading.Lock()
+        if cache_path is not None:
+            # Shared by the worker threads of download_media and search_by_name_many
+            self._cache = sqlite3.connect(str(cache_path), check_same_thread=False)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts INTEGER, json BLOB)"
+            )
     
     def _rate_limit(self):
         """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        delay = self._reserve_request_slot()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve a start time for the next request and return how long to wait for it.
         
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
+        Requests are spaced by request_delay until the server has reported the
+        account's per-minute allowance. After that, they may burst as long as
+        no more than that many requests start within any 60 second window.
+        """
+        with self._rate_lock:
+            if self.requests_today is not None and self.requests_today >= self.daily_quota:
+                raise APIQuotaExceededError(
+                    f"Daily quota of {self.daily_quota} requests reached"
+                )
+            
+            now = time.monotonic()
+            window = self._request_times
+            if window is not None:
+                start = now
+                if len(window) == window.maxlen:
+                    start = max(now, window[0] + 60)
+                window.append(start)
+            else:
+                start = max(now, self.last_request_time + self.request_delay)
+            
+            self.last_request_time = start
+            if self.requests_today is not None:
+                self.requests_today += 1
+            return start - now
+    
+    def _update_quota(self, data: Dict):
+        """Update rate limits from the account usage the server reports with each response."""
+        ssuser = data.get('response', {}).get('ssuser')
+        if not ssuser:
+            return
         
-        self.last_request_time = time.time()
+        try:
+            requests_per_minute = int(ssuser.get('maxrequestspermin', 0))
+            max_threads = int(ssuser.get('maxthreads', 0))
+            requests_today = int(ssuser.get('requeststoday', 0))
+            max_requests_per_day = int(ssuser.get('maxrequestsperday', 0))
+        except (TypeError, ValueError):
+            return
+        
+        with self._rate_lock:
+            if max_threads:
+                self.max_threads = max_threads
+            if max_requests_per_day:
+                if self.max_requests_per_day is not None:
+                    max_requests_per_day = min(max_requests_per_day, self.max_requests_per_day)
+                self.daily_quota = max_requests_per_day
+                self.requests_today = requests_today
+            if self.adaptive_rate_limit and requests_per_minute:
+                window = self._request_times
+                if window is None or window.maxlen != requests_per_minute:
+                    self._request_times = deque(window or (), maxlen=requests_per_minute)
     
     def _build_params(self, **kwargs) -> Dict[str, str]:
         """Build common API parameters."""
@@ -229,41 +618,119 @@ class ScreenScraperClient:
         params.update(kwargs)
         return params
     
+    def _cache_key(self, endpoint: str, params: Dict[str, str]) -> str:
+        """Build a cache key from the endpoint and parameters, ignoring passwords."""
+        filtered = sorted((k, v) for k, v in params.items() if k not in self.CACHE_EXCLUDED_PARAMS)
+        return hashlib.blake2b(f"{endpoint}?{urlencode(filtered)}".encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Return a cached response if present and not expired."""
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT json FROM cache WHERE key = ? AND ts > ?",
+                (key, int(time.time()) - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        try:
+            data = pickle.loads(zlib.decompress(row[0]))
+        except Exception:
+            # Unreadable entry, e.g. written by an older version in another format
+            return None
+        
+        # A pruned response lacks the full game data that store_raw keeps
+        if self.store_raw and data.get(_PRUNED_KEY):
+            return None
+        return data
+    
+    def _cache_put(self, key: str, data: Dict):
+        """Store a parsed response in the cache."""
+        # Pickling the parsed dict is faster to write and read back than JSON,
+        # and level 1 compression keeps cache hits cheap
+        payload = zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        with self._cache_lock, self._cache:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO cache (key, ts, json) VALUES (?, ?, ?)",
+                (key, int(time.time()), payload)
+            )
+    
+    @staticmethod
+    def _loads_response(content: bytes) -> Dict:
+        """Parse a raw response body, working around malformed JSON from ScreenScraper."""
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            # Try to fix common JSON issues from ScreenScraper
+            return _json_loads(content.replace(_MALFORMED_JSON, _MALFORMED_JSON_FIX))
+    
     def _make_request(self, endpoint: str, params: Dict[str, str]) -> Dict:
         """Make a request to the ScreenScraper API."""
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache_key(endpoint, params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
         self._rate_limit()
         
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            # Handle potential encoding issues
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                # Try to fix common JSON issues from ScreenScraper
-                text = response.text.replace('],\n\t\t}', ']\n\t\t}')
-                data = json.loads(text)
-            
-            self.request_count += 1
-            
-            # Check for API errors in response
-            header = data.get('header', {})
-            if 'erreur' in header:
-                error_msg = header['erreur']
-                if 'quota' in error_msg.lower():
-                    raise APIQuotaExceededError(f"API quota exceeded: {error_msg}")
-                elif 'fermé' in error_msg.lower() or 'closed' in error_msg.lower():
-                    raise APIClosedError(f"API closed: {error_msg}")
+            with self.session.get(url, params=params, timeout=30, stream=True) as response:
+                self._server_responded = True
+                
+                # Unknown games and ROMs come back as a 404 error page
+                if response.status_code == 404:
+                    raise GameNotFoundError(f"Game not found: {response.text.strip()}")
+                response.raise_for_status()
+                
+                if self._should_stream_parse(response):
+                    data = _stream_parse_json(
+                        _JSONFixupReader(response.iter_content(chunk_size=64 * 1024)),
+                        self.STREAMED_FIELDS
+                    )
+                    data[_PRUNED_KEY] = True
                 else:
-                    raise ScreenScraperError(f"API error: {error_msg}")
+                    data = self._loads_response(response.content)
             
+            data = self._check_response(data)
+            if cache_key is not None:
+                self._cache_put(cache_key, data)
             return data
             
         except requests.RequestException as e:
-            raise ScreenScraperError(f"Request failed: {e}")
+            raise _request_error(e, e.response.status_code if e.response is not None else None)
+    
+    def _should_stream_parse(self, response: requests.Response) -> bool:
+        """Whether a response is large enough to parse incrementally instead of all at once."""
+        if ijson is None or self.store_raw:
+            return False
+        try:
+            return int(response.headers.get('Content-Length', 0)) > STREAM_PARSE_MIN_SIZE
+        except ValueError:
+            return False
+    
+    def _check_response(self, data: Dict) -> Dict:
+        """Count a completed request and raise on API errors reported in the response."""
+        self.request_count += 1
+        
+        # Check for API errors in response
+        header = data.get('header', {})
+        if 'erreur' in header:
+            error_msg = header['erreur']
+            if 'quota' in error_msg.lower():
+                raise APIQuotaExceededError(f"API quota exceeded: {error_msg}")
+            elif 'fermé' in error_msg.lower() or 'closed' in error_msg.lower():
+                raise APIClosedError(f"API closed: {error_msg}")
+            elif 'non trouvé' in error_msg.lower():
+                raise GameNotFoundError(f"Game not found: {error_msg}")
+            else:
+                raise ScreenScraperError(f"API error: {error_msg}")
+        
+        self._update_quota(data)
+        return data
     
     @staticmethod
     def calculate_file_hashes(file_path: Union[str, Path]) -> Tuple[str, str, str]:
@@ -273,16 +740,22 @@ class ScreenScraperClient:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # For large files, we should be careful about memory usage
-        file_size = file_path.stat().st_size
-        chunk_size = 64 * 1024  # 64KB chunks
-        
         md5_hash = hashlib.md5()
         sha1_hash = hashlib.sha1()
         crc32_hash = 0
         
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(chunk_size):
+        for chunk in _iter_file_chunks(file_path):
+            if len(chunk) >= PARALLEL_HASH_MIN_SIZE:
+                # The hashers release the GIL, so disc images get all
+                # three passes over the mapping at once
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    md5_future = executor.submit(md5_hash.update, chunk)
+                    sha1_future = executor.submit(sha1_hash.update, chunk)
+                    crc32_future = executor.submit(zlib.crc32, chunk, crc32_hash)
+                    md5_future.result()
+                    sha1_future.result()
+                    crc32_hash = crc32_future.result()
+            else:
                 md5_hash.update(chunk)
                 sha1_hash.update(chunk)
                 crc32_hash = zlib.crc32(chunk, crc32_hash)
@@ -293,6 +766,20 @@ class ScreenScraperClient:
             f"{crc32_hash & 0xFFFFFFFF:08X}"
         )
     
+    @staticmethod
+    def calculate_file_crc32(file_path: Union[str, Path]) -> str:
+        """Calculate only the CRC32 hash of a ROM file."""
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        crc32_hash = 0
+        for chunk in _iter_file_chunks(file_path):
+            crc32_hash = zlib.crc32(chunk, crc32_hash)
+        
+        return f"{crc32_hash & 0xFFFFFFFF:08X}"
+    
     def search_by_file(self, 
                       file_path: Union[str, Path], 
                       platform: str,
@@ -300,6 +787,10 @@ class ScreenScraperClient:
         """
         Search for a game by ROM file (using file hashes).
         
+        The ROM is first looked up by CRC32 alone, which identifies most
+        cartridge games. MD5 and SHA1 are only computed when that misses, so
+        a ROM that is not in the database costs two requests of quota.
+        
         Args:
             file_path: Path to the ROM file
             platform: Platform name (e.g., 'nes', 'snes', 'psx')
@@ -308,6 +799,30 @@ class ScreenScraperClient:
         Returns:
             GameInfo object if found, None otherwise
         """
+        for full_hashes in (False, True):
+            params = self._file_search_params(file_path, platform, rom_name, full_hashes)
+            if params is None:
+                return None
+            
+            try:
+                data = self._make_request('jeuInfos.php', params)
+                return self._parse_game_data(data)
+            except GameNotFoundError:
+                continue
+        
+        return None
+    
+    def _file_search_params(self, 
+                            file_path: Union[str, Path], 
+                            platform: str,
+                            rom_name: Optional[str] = None,
+                            full_hashes: bool = False) -> Optional[Dict[str, str]]:
+        """
+        Build jeuInfos.php parameters for a ROM file, or None if it cannot be hashed.
+        
+        Only the CRC32 is sent unless full_hashes is set, in which case MD5 and
+        SHA1 are computed and sent as well.
+        """
         file_path = Path(file_path)
         
         if platform not in self.PLATFORMS:
@@ -315,7 +830,11 @@ class ScreenScraperClient:
         
         # Calculate file hashes
         try:
-            md5, sha1, crc = self.calculate_file_hashes(file_path)
+            if full_hashes:
+                md5, sha1, crc = self.calculate_file_hashes(file_path)
+                hashes = {'md5': md5, 'sha1': sha1, 'crc': crc}
+            else:
+                hashes = {'crc': self.calculate_file_crc32(file_path)}
         except Exception as e:
             logger.error(f"Failed to calculate hashes for {file_path}: {e}")
             return None
@@ -323,21 +842,13 @@ class ScreenScraperClient:
         rom_name = rom_name or file_path.name
         file_size = file_path.stat().st_size
         
-        params = self._build_params(
-            md5=md5,
-            sha1=sha1,
-            crc=crc,
+        return self._build_params(
+            **hashes,
             romnom=rom_name,
             romtaille=str(file_size),
             systemeid=str(self.PLATFORMS[platform]),
             romtype='rom'
         )
-        
-        try:
-            data = self._make_request('jeuInfos.php', params)
-            return self._parse_game_data(data)
-        except GameNotFoundError:
-            return None
     
     def search_by_name(self, 
                       game_name: str, 
@@ -352,13 +863,7 @@ class ScreenScraperClient:
         Returns:
             GameInfo object if found, None otherwise
         """
-        if platform not in self.PLATFORMS:
-            raise ValueError(f"Unsupported platform: {platform}")
-        
-        params = self._build_params(
-            recherche=game_name,
-            systemeid=str(self.PLATFORMS[platform])
-        )
+        params = self._name_search_params(game_name, platform)
         
         try:
             data = self._make_request('jeuInfos.php', params)
@@ -366,6 +871,54 @@ class ScreenScraperClient:
         except GameNotFoundError:
             return None
     
+    def search_by_name_many(self, 
+                            queries: List[Tuple[str, str]],
+                            return_exceptions: bool = False) -> List[Optional[GameInfo]]:
+        """
+        Search for several games by name and platform in parallel.
+        
+        ScreenScraper has no multi-game lookup, so the searches run on a small
+        thread pool sharing the client's connection pool and rate limiter. Until
+        the server has answered once, searches run one at a time so that the
+        account's maxthreads is known before the pool is sized to it.
+        
+        Args:
+            queries: List of (game_name, platform) tuples
+            return_exceptions: Return a failed search's exception in its place
+                instead of raising it, as with asyncio.gather
+            
+        Returns:
+            List of GameInfo objects (or None when not found), in input order
+        """
+        def search(query: Tuple[str, str]) -> Optional[GameInfo]:
+            try:
+                return self.search_by_name(*query)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+        
+        results = []
+        while len(results) < len(queries) and not self._server_responded:
+            results.append(search(queries[len(results)]))
+        
+        remaining = queries[len(results):]
+        if remaining:
+            workers = min(len(remaining), self.MAX_SEARCH_WORKERS, self.max_threads or self.MAX_SEARCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results.extend(executor.map(search, remaining))
+        return results
+    
+    def _name_search_params(self, game_name: str, platform: str) -> Dict[str, str]:
+        """Build jeuInfos.php parameters for a name search."""
+        if platform not in self.PLATFORMS:
+            raise ValueError(f"Unsupported platform: {platform}")
+        
+        return self._build_params(
+            recherche=game_name,
+            systemeid=str(self.PLATFORMS[platform])
+        )
+    
     def search_by_id(self, game_id: str) -> Optional[GameInfo]:
         """
         Search for a game by ScreenScraper game ID.
@@ -407,7 +960,7 @@ class ScreenScraperClient:
             release_date=self._get_release_date(jeu.get('dates', [])),
             genre=self._get_text_from_list(jeu.get('genres', [])),
             system=jeu.get('systeme', {}).get('text', ''),
-            raw_data=jeu
+            raw_data=jeu if self.store_raw else {}
         )
         
         # Parse media
@@ -427,6 +980,7 @@ class ScreenScraperClient:
                     )
                     game_info.media.append(game_media)
         
+        game_info._index_media()
         return game_info
     
     def _get_localized_text(self, text_list: List[Dict]) -> str:
@@ -444,8 +998,6 @@ class ScreenScraperClient:
     
     def _get_text_from_list(self, item_list: List[Dict]) -> str:
         """Extract text from a list of items."""
-        if not item_list:
-            return ""
         return item_list[0].get('text', '') if item_list else ""
     
     def _get_release_date(self, dates_list: List[Dict]) -> str:
@@ -459,7 +1011,7 @@ class ScreenScraperClient:
                 return date_item.get('text', '')
         
         # Fall back to first available date
-        return dates_list[0].get('text', '') if dates_list else ""
+        return dates_list[0].get('text', '')
     
     def download_media(self, 
                       game_info: GameInfo, 
@@ -469,6 +1021,9 @@ class ScreenScraperClient:
         """
         Download specific media types for a game.
         
+        Downloads run in parallel on a small thread pool sharing the client's
+        connection pool.
+        
         Args:
             game_info: GameInfo object
             media_types: List of media types to download
@@ -482,21 +1037,326 @@ class ScreenScraperClient:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         results = {}
+        downloads = {}
         
         for media_type in media_types:
+            results[media_type] = False
             media = game_info.get_best_media(media_type, preferred_regions)
             if media:
-                # Generate filename
-                safe_name = "".join(c for c in game_info.name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                filename = f"{safe_name}_{media_type}.{media.format}"
-                filepath = output_dir / filename
-                
-                results[media_type] = media.download(filepath)
+                filepath = output_dir / self._media_filename(game_info, media_type, media)
+                downloads[media_type] = (media, filepath)
             else:
                 logger.warning(f"No {media_type} media found for {game_info.name}")
-                results[media_type] = False
+        
+        if downloads:
+            with ThreadPoolExecutor(max_workers=min(len(downloads), self.MAX_DOWNLOAD_WORKERS)) as executor:
+                futures = {
+                    executor.submit(media.download, filepath, session=self.session): media_type
+                    for media_type, (media, filepath) in downloads.items()
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
         
         return results
+    
+    @staticmethod
+    def _media_filename(game_info: GameInfo, media_type: str, media: GameMedia) -> str:
+        """Generate a filesystem-safe filename for a downloaded media item."""
+        safe_name = _UNSAFE_FILENAME_RE.sub('', game_info.name).rstrip()
+        return f"{safe_name}_{media_type}.{media.format}"
+
+
+class _AsyncLimiter:
+    """
+    Async context manager letting at most ``limit`` tasks in at once.
+    
+    Unlike asyncio.Semaphore, the limit can be changed while tasks are
+    waiting or holding it; a lower limit applies to every later entry.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._cond = asyncio.Condition()
+    
+    def resize(self, limit: int):
+        """Change the limit, waking waiters if it was raised."""
+        raised = limit > self.limit
+        self.limit = limit
+        if raised:
+            asyncio.ensure_future(self._notify())
+    
+    async def _notify(self):
+        async with self._cond:
+            self._cond.notify_all()
+    
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
+class AsyncScreenScraperClient(ScreenScraperClient):
+    """
+    Asynchronous client for batch scraping the ScreenScraper.fr API.
+    
+    Shares the configuration and parsing of ScreenScraperClient, but issues
+    requests on an aiohttp session so that up to ``concurrency`` API calls and
+    media downloads are in flight at once. Must be used as an async context
+    manager:
+    
+        async with AsyncScreenScraperClient(dev_id, dev_password) as client:
+            games = await client.search_many([(rom, 'nes') for rom in roms])
+    
+    Requires the optional ``aiohttp`` and ``aiofiles`` packages.
+    """
+    
+    def __init__(self, *args, concurrency: int = 4, **kwargs):
+        """
+        Initialize the async client.
+        
+        Args:
+            *args, **kwargs: Same as ScreenScraperClient
+            concurrency: Maximum number of requests in flight at once
+        """
+        if aiohttp is None or aiofiles is None:
+            raise ImportError("AsyncScreenScraperClient requires aiohttp and aiofiles: "
+                              "pip install aiohttp aiofiles")
+        
+        super().__init__(*args, **kwargs)
+        self.concurrency = concurrency
+        
+        # Created in __aenter__ so they bind to the running event loop
+        self._http: Optional["aiohttp.ClientSession"] = None
+        self._limiter: Optional[_AsyncLimiter] = None
+        # With adaptive_rate_limit, one request runs at a time until the
+        # first response of any kind arrives; a successful one also tells us
+        # the account's maxthreads
+        self._limit = 1 if self.adaptive_rate_limit else concurrency
+        self._inflight: Dict[str, "asyncio.Future[Dict]"] = {}
+    
+    async def __aenter__(self) -> "AsyncScreenScraperClient":
+        self._limiter = _AsyncLimiter(self._limit)
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64),
+            headers=dict(self.session.headers)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._http.close()
+        self._http = None
+    
+    async def _rate_limit_async(self):
+        """Apply rate limiting between request starts without blocking the event loop."""
+        delay = self._reserve_request_slot()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _update_quota(self, data: Dict):
+        """Update rate limits, and never run more requests at once than the account's maxthreads."""
+        super()._update_quota(data)
+        self._apply_thread_limit()
+    
+    def _apply_thread_limit(self):
+        """Allow min(concurrency, maxthreads) requests at once, or concurrency if maxthreads is unknown."""
+        size = self.concurrency
+        if self.adaptive_rate_limit and self.max_threads:
+            size = min(self.concurrency, self.max_threads)
+        if size != self._limit:
+            # Requests already running finish; waiting ones see the new limit
+            self._limit = size
+            if self._limiter is not None:
+                self._limiter.resize(size)
+    
+    def _check_open(self):
+        """Raise unless the client has been entered with 'async with'."""
+        if self._http is None:
+            raise RuntimeError("AsyncScreenScraperClient must be used with 'async with'")
+    
+    async def _make_request(self, endpoint: str, params: Dict[str, str]) -> Dict:
+        """
+        Make a request to the ScreenScraper API.
+        
+        Identical requests made while one is already in flight (e.g. regional
+        variants of a ROM sharing a CRC) wait for that response instead of
+        sending their own.
+        """
+        self._check_open()
+        
+        key = self._cache_key(endpoint, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so that one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, endpoint: str, params: Dict[str, str], cache_key: str) -> Dict:
+        """Fetch a response from the cache or the ScreenScraper API."""
+        if self._cache is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        url = f"{self.BASE_URL}/{endpoint}"
+        
+        async with self._limiter:
+            await self._rate_limit_async()
+            
+            try:
+                async with self._http.get(url, params=params,
+                                          timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    # Error pages carry no account limits, but the server is up,
+                    # so stop sending one request at a time
+                    if response.status >= 400:
+                        self._apply_thread_limit()
+                    
+                    # Unknown games and ROMs come back as a 404 error page
+                    if response.status == 404:
+                        raise GameNotFoundError(f"Game not found: {(await response.text()).strip()}")
+                    response.raise_for_status()
+                    content = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise _request_error(e, getattr(e, 'status', None))
+        
+        data = self._check_response(self._loads_response(content))
+        if self._cache is not None:
+            self._cache_put(cache_key, data)
+        return data
+    
+    async def search_by_file(self, 
+                             file_path: Union[str, Path], 
+                             platform: str,
+                             rom_name: Optional[str] = None) -> Optional[GameInfo]:
+        """Search for a game by ROM file (using file hashes). See ScreenScraperClient.search_by_file."""
+        loop = asyncio.get_running_loop()
+        
+        for full_hashes in (False, True):
+            # Hashing is CPU and disk bound, keep it off the event loop
+            params = await loop.run_in_executor(
+                None, self._file_search_params, file_path, platform, rom_name, full_hashes
+            )
+            if params is None:
+                return None
+            
+            try:
+                data = await self._make_request('jeuInfos.php', params)
+                return self._parse_game_data(data)
+            except GameNotFoundError:
+                continue
+        
+        return None
+    
+    async def search_by_name(self, game_name: str, platform: str) -> Optional[GameInfo]:
+        """Search for a game by name and platform. See ScreenScraperClient.search_by_name."""
+        params = self._name_search_params(game_name, platform)
+        
+        try:
+            data = await self._make_request('jeuInfos.php', params)
+            return self._parse_game_data(data)
+        except GameNotFoundError:
+            return None
+    
+    async def search_by_name_many(self, 
+                                  queries: List[Tuple[str, str]],
+                                  return_exceptions: bool = False) -> List[Optional[GameInfo]]:
+        """Search for several games by name and platform concurrently. See ScreenScraperClient.search_by_name_many."""
+        return await asyncio.gather(*[
+            self.search_by_name(game_name, platform) for game_name, platform in queries
+        ], return_exceptions=return_exceptions)
+    
+    async def search_by_id(self, game_id: str) -> Optional[GameInfo]:
+        """Search for a game by ScreenScraper game ID. See ScreenScraperClient.search_by_id."""
+        params = self._build_params(gameid=game_id)
+        
+        try:
+            data = await self._make_request('jeuInfos.php', params)
+            return self._parse_game_data(data)
+        except GameNotFoundError:
+            return None
+    
+    async def search_many(self, 
+                          roms: List[Tuple[Union[str, Path], str]]) -> List[Optional[GameInfo]]:
+        """
+        Search for many ROM files concurrently.
+        
+        Args:
+            roms: List of (file_path, platform) tuples
+            
+        Returns:
+            List of GameInfo objects (or None when not found), in input order
+        """
+        return await asyncio.gather(*[
+            self.search_by_file(file_path, platform) for file_path, platform in roms
+        ])
+    
+    async def search_by_names(self, 
+                              names: List[str], 
+                              platform: str) -> Dict[str, Optional[GameInfo]]:
+        """
+        Search for many game names on one platform concurrently.
+        
+        Names that differ only in case are looked up once, so libraries with
+        several copies or regional variants of a title spend fewer requests.
+        
+        Args:
+            names: Game names to look up
+            platform: Platform name
+            
+        Returns:
+            Dictionary mapping each given name to its GameInfo, or None if not found
+        """
+        unique = {name.lower(): name for name in names}
+        games = await asyncio.gather(*[
+            self.search_by_name(name, platform) for name in unique.values()
+        ])
+        by_key = dict(zip(unique, games))
+        return {name: by_key[name.lower()] for name in names}
+    
+    async def download_media(self, 
+                             game_info: GameInfo, 
+                             media_types: List[str], 
+                             output_dir: Union[str, Path],
+                             preferred_regions: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Download specific media types for a game concurrently. See ScreenScraperClient.download_media."""
+        self._check_open()
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        async def download(media_type: str) -> bool:
+            media = game_info.get_best_media(media_type, preferred_regions)
+            if not media:
+                logger.warning(f"No {media_type} media found for {game_info.name}")
+                return False
+            
+            filepath = output_dir / self._media_filename(game_info, media_type, media)
+            async with self._limiter:
+                return await media.download_async(filepath, self._http)
+        
+        successes = await asyncio.gather(*[download(media_type) for media_type in media_types])
+        return dict(zip(media_types, successes))
+
+
+def run_async(main: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Use in place of asyncio.run() to drive AsyncScreenScraperClient. uvloop's
+    libuv-based event loop handles many concurrent connections with less
+    overhead than the default asyncio loop.
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
 
 
 # Convenience functions for common use cases
@@ -556,9 +1416,6 @@ def download_box_art(dev_id: str,
 
 # Example usage and testing
 if __name__ == "__main__":
-    # Example usage
-    import os
-    
     # You need to get these from https://www.screenscraper.fr/
     DEV_ID = os.getenv('SCREENSCRAPER_DEV_ID', 'your_dev_id')
     DEV_PASSWORD = os.getenv('SCREENSCRAPER_DEV_PASSWORD', 'your_dev_password')
@@ -13,35 +13,51 @@ Before running, make sure to set your API credentials:
 - SCREENSCRAPER_USER_PASSWORD (optional but recommended)
 """
 
-import os
+import argparse
+import functools
 import sys
+from collections import defaultdict, namedtuple
+from operator import itemgetter
 from pathlib import Path
 import json
 
-# Import the library (adjust import based on your setup)
-try:
-    from screenscraper import (
-        ScreenScraperClient, 
-        GameInfo, 
-        GameMedia,
-        ScreenScraperError,
-        APIQuotaExceededError,
-        APIClosedError,
-        GameNotFoundError,
-        quick_search,
-        download_box_art
-    )
-except ImportError:
-    print("Please ensure the screenscraper.py file is in your Python path")
-    sys.exit(1)
+# API responses are cached here, so re-running the examples answers the same
+# lookups from disk instead of spending quota on them again
+CACHE_PATH = Path('./screenscraper_cache.sqlite')
+
+# Sample media downloads go here; main() creates it once before the examples run
+TEMP_DIR = Path('./temp_downloads')
+
+# Preferred media regions, mapped to their rank (lower is better). The
+# default order is the one GameInfo.get_best_media uses; box art skips Japan.
+REGION_PREF = {'us': 0, 'wor': 1, 'eu': 2, 'jp': 3}
+BOX_ART_REGION_PREF = {'us': 0, 'wor': 1, 'eu': 2}
+
+# REGION_PREF as the ordered list that get_best_media takes
+PREFERRED_REGIONS = sorted(REGION_PREF, key=REGION_PREF.get)
 
+# PLATFORMS sorted by name, computed on first use by example_4
+_SORTED_PLATFORMS = None
 
+Credentials = namedtuple('Credentials', 'dev_id dev_password user_id user_password')
+
+
+@functools.lru_cache(maxsize=1)
 def get_credentials():
-    """Get API credentials from config.json file."""
+    """
+    Get API credentials from config.json file.
+    
+    The file is read once per run; a failed read is cached as None too, so
+    later calls return immediately without touching the filesystem again.
+    """
+    # orjson is quicker if you have it; both parse the raw bytes of the file
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
     
     try:
-        with open('config.json', 'r') as f:
-            config = json.load(f)
+        config = loads(Path('config.json').read_bytes())
         
         dev_id = config.get('screenscraper', {}).get('dev_id')
         dev_password = config.get('screenscraper', {}).get('dev_password')
@@ -62,31 +78,16 @@ def get_credentials():
         print("You can get these credentials from https://www.screenscraper.fr/")
         return None
     
-    return dev_id, dev_password, user_id, user_password
+    return Credentials(dev_id, dev_password, user_id, user_password)
 
 
-def example_1_basic_search():
+def example_1_basic_search(client):
     """Example 1: Basic game search by name."""
     print("\n" + "="*50)
     print("EXAMPLE 1: Basic Game Search")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
-        # Initialize client
-        client = ScreenScraperClient(
-            dev_id=dev_id,
-            dev_password=dev_password,
-            user_id=user_id,
-            user_password=user_password,
-            software_name="ScreenScraperPython Examples"
-        )
-        
         # Search for a well-known game
         print("Searching for 'Super Mario Bros' on NES...")
         game = client.search_by_name("Super Mario Bros", "nes")
@@ -102,35 +103,25 @@ def example_1_basic_search():
             print(f"  Available media types: {len(game.media)} items")
             
             # Show available media
-            media_types = set(m.media_type for m in game.media)
+            media_types = {m.media_type for m in game.media}
             print(f"  Media types: {', '.join(sorted(media_types))}")
         else:
             print("✗ Game not found")
             
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
 
 
-def example_2_search_by_id():
+def example_2_search_by_id(client):
     """Example 2: Search by ScreenScraper game ID."""
     print("\n" + "="*50)
     print("EXAMPLE 2: Search by Game ID")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
-        client = ScreenScraperClient(
-            dev_id=dev_id,
-            dev_password=dev_password,
-            user_id=user_id,
-            user_password=user_password
-        )
-        
         # Search for a game by ID (this is a known Super Mario Bros ID)
         print("Searching for game ID 3...")
         game = client.search_by_id("3")
@@ -144,28 +135,26 @@ def example_2_search_by_id():
             
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
+
 
+def pick_best(media_list, region_rank=REGION_PREF):
+    """Pick the item whose region ranks best in region_rank, else the first item."""
+    if not media_list:
+        return None
+    
+    return min(media_list, key=lambda media: region_rank.get(media.region.lower(), len(region_rank)))
 
-def example_3_media_operations():
+
+def example_3_media_operations(client):
     """Example 3: Working with game media."""
     print("\n" + "="*50)
     print("EXAMPLE 3: Media Operations")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
-        client = ScreenScraperClient(
-            dev_id=dev_id,
-            dev_password=dev_password,
-            user_id=user_id,
-            user_password=user_password
-        )
-        
         # Search for a game with rich media
         print("Searching for 'The Legend of Zelda' on NES...")
         game = client.search_by_name("The Legend of Zelda", "nes")
@@ -177,10 +166,8 @@ def example_3_media_operations():
             print(f"\nMedia Analysis:")
             print(f"  Total media items: {len(game.media)}")
             
-            media_by_type = {}
+            media_by_type = defaultdict(list)
             for media in game.media:
-                if media.media_type not in media_by_type:
-                    media_by_type[media.media_type] = []
                 media_by_type[media.media_type].append(media)
             
             for media_type, media_list in media_by_type.items():
@@ -191,23 +178,20 @@ def example_3_media_operations():
             # Get best media examples
             print(f"\nBest Media Examples:")
             
-            box_art = game.get_best_media('box-2D', ['us', 'wor', 'eu'])
+            box_art = pick_best(media_by_type['box-2D'], BOX_ART_REGION_PREF)
             if box_art:
                 print(f"  Best box art: {box_art.format} from {box_art.region}")
             
-            screenshot = game.get_best_media('screenshot')
+            screenshot = pick_best(media_by_type['screenshot'])
             if screenshot:
                 print(f"  Best screenshot: {screenshot.format}")
             
             # Demonstrate download (to temp directory)
-            temp_dir = Path('./temp_downloads')
-            temp_dir.mkdir(exist_ok=True)
-            
-            print(f"\nDownloading sample media to {temp_dir}...")
+            print(f"\nDownloading sample media to {TEMP_DIR}...")
             results = client.download_media(
                 game, 
                 ['box-2D'], 
-                temp_dir,
+                TEMP_DIR,
                 preferred_regions=['us', 'wor']
             )
             
@@ -220,28 +204,20 @@ def example_3_media_operations():
             
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
 
 
-def example_4_platform_support():
+def example_4_platform_support(client):
     """Example 4: Demonstrate platform support."""
+    global _SORTED_PLATFORMS
+    
     print("\n" + "="*50)
     print("EXAMPLE 4: Platform Support")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
-        client = ScreenScraperClient(
-            dev_id=dev_id,
-            dev_password=dev_password,
-            user_id=user_id,
-            user_password=user_password
-        )
-        
         # Test different platforms
         test_games = [
             ("Sonic the Hedgehog", "genesis"),
@@ -252,54 +228,61 @@ def example_4_platform_support():
         
         print("Testing different platforms:")
         
-        for game_name, platform in test_games:
-            print(f"\n  Searching '{game_name}' on {platform.upper()}...")
+        # All searches are sent at once; results come back in test_games order,
+        # with a failed search's exception in place of its game
+        games = client.search_by_name_many(test_games, return_exceptions=True)
+        
+        out = []
+        for (game_name, platform), game in zip(test_games, games):
+            out.append(f"\n  Searching '{game_name}' on {platform.upper()}...")
             
-            try:
-                game = client.search_by_name(game_name, platform)
-                if game:
-                    print(f"    ✓ Found: {game.name}")
-                    print(f"      System: {game.system}")
-                    print(f"      Media items: {len(game.media)}")
-                else:
-                    print(f"    ✗ Not found")
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
+            if isinstance(game, Exception):
+                out.append(f"    ✗ Error: {game}")
+            elif game:
+                out.append(f"    ✓ Found: {game.name}")
+                out.append(f"      System: {game.system}")
+                out.append(f"      Media items: {len(game.media)}")
+            else:
+                out.append(f"    ✗ Not found")
                 
         # Show supported platforms
-        print(f"\nSupported platforms ({len(client.PLATFORMS)}):")
-        for platform, system_id in sorted(client.PLATFORMS.items()):
-            print(f"  {platform}: {system_id}")
+        out.append(f"\nSupported platforms ({len(client.PLATFORMS)}):")
+        if _SORTED_PLATFORMS is None:
+            _SORTED_PLATFORMS = sorted(client.PLATFORMS.items(), key=itemgetter(0))
+        for platform, system_id in _SORTED_PLATFORMS:
+            out.append(f"  {platform}: {system_id}")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
             
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
 
 
-def example_5_error_handling():
+def example_5_error_handling(client):
     """Example 5: Demonstrate error handling."""
     print("\n" + "="*50)
     print("EXAMPLE 5: Error Handling")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
+    from screenscraper import GameNotFoundError
     
-    # Test with invalid credentials
     print("Testing error handling scenarios:")
+    ok = True
     
     # 1. Invalid platform
     try:
-        client = ScreenScraperClient(dev_id, dev_password)
         game = client.search_by_name("Test", "invalid_platform")
     except ValueError as e:
         print(f"  ✓ Caught invalid platform error: {e}")
+    except Exception as e:
+        print(f"  ⚠ Unexpected error: {e}")
+        ok = False
     
     # 2. Non-existent game
     try:
-        client = ScreenScraperClient(dev_id, dev_password, user_id=user_id, user_password=user_password)
         game = client.search_by_name("This Game Does Not Exist 12345", "nes")
         if not game:
             print(f"  ✓ Correctly handled non-existent game (returned None)")
@@ -307,6 +290,7 @@ def example_5_error_handling():
         print(f"  ✓ Caught GameNotFoundError for non-existent game")
     except Exception as e:
         print(f"  ⚠ Unexpected error: {e}")
+        ok = False
     
     # 3. Invalid game ID
     try:
@@ -317,20 +301,17 @@ def example_5_error_handling():
         print(f"  ✓ Caught GameNotFoundError for invalid ID")
     except Exception as e:
         print(f"  ⚠ Unexpected error: {e}")
+        ok = False
+    
+    return ok
 
 
-def example_6_convenience_functions():
+def example_6_convenience_functions(client):
     """Example 6: Using convenience functions."""
     print("\n" + "="*50)
     print("EXAMPLE 6: Convenience Functions")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
         # Quick search example
         print("Using quick_search function...")
@@ -349,28 +330,67 @@ def example_6_convenience_functions():
         
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
+
+
+async def _search_with_retry(client_async, game_name, platform, attempts=4):
+    """Search by name, retrying network and server failures with exponential backoff and jitter."""
+    import asyncio
+    import random
+    from screenscraper import APIUnavailableError
+    
+    # Other errors, such as a closed API, quota or bad credentials, won't
+    # go away on a retry and are raised straight away
+    for attempt in range(attempts):
+        try:
+            return await client_async.search_by_name(game_name, platform)
+        except APIUnavailableError:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(2 ** attempt + random.uniform(0, 1))
+
+
+async def example_7_async(client_async, games):
+    """Search a collection of games concurrently, returning one result dict per game in order."""
+    import asyncio
+    
+    async def process(game_name, platform):
+        try:
+            game = await _search_with_retry(client_async, game_name, platform)
+        except Exception as e:
+            return {'name': game_name, 'platform': platform, 'error': str(e)}
+        
+        if not game:
+            return {'name': game_name, 'platform': platform, 'found': False}
+        
+        # Look up the best media once; the items are kept for later use
+        best = {media_type: game.get_best_media(media_type, PREFERRED_REGIONS) for media_type in ('box-2D', 'screenshot')}
+        
+        return {
+            'name': game.name,
+            'platform': platform,
+            'found': True,
+            'media_count': len(game.media),
+            'box_art': best['box-2D'],
+            'screenshot': best['screenshot'],
+            'publisher': game.publisher,
+            'year': game.release_date
+        }
+    
+    async with client_async:
+        return await asyncio.gather(*[process(game_name, platform) for game_name, platform in games])
 
 
-def example_7_batch_processing_simulation():
+def example_7_batch_processing_simulation(client):
     """Example 7: Simulate batch processing workflow."""
     print("\n" + "="*50)
     print("EXAMPLE 7: Batch Processing Simulation")
     print("="*50)
     
-    credentials = get_credentials()
-    if not credentials:
-        return
-    
-    dev_id, dev_password, user_id, user_password = credentials
-    
     try:
-        client = ScreenScraperClient(
-            dev_id=dev_id,
-            dev_password=dev_password,
-            user_id=user_id,
-            user_password=user_password,
-            request_delay=1.5  # Be extra respectful with delays
-        )
+        from screenscraper import AsyncScreenScraperClient, run_async
         
         # Simulate processing a collection of games
         game_collection = [
@@ -379,75 +399,86 @@ def example_7_batch_processing_simulation():
             ("Tetris", "gameboy"),
         ]
         
+        # Batches run concurrently on an async client. Four requests at a time
+        # stays within ScreenScraper's per-user thread limit, and the client
+        # paces itself by the quota the server reports.
+        client_async = AsyncScreenScraperClient(
+            dev_id=client.dev_id,
+            dev_password=client.dev_password,
+            user_id=client.user_id,
+            user_password=client.user_password,
+            software_name=client.software_name,
+            cache_path=CACHE_PATH,
+            concurrency=4
+        )
+        
         print("Simulating batch processing of game collection:")
         
-        results = []
+        results = run_async(example_7_async(client_async, game_collection))
         
-        for game_name, platform in game_collection:
-            print(f"\n  Processing: {game_name} ({platform.upper()})")
+        out = []
+        found_count = 0
+        for (game_name, platform), result in zip(game_collection, results):
+            out.append(f"\n  Processing: {game_name} ({platform.upper()})")
             
-            try:
-                game = client.search_by_name(game_name, platform)
-                
-                if game:
-                    print(f"    ✓ Found: {game.name}")
-                    
-                    # Count available media
-                    media_count = len(game.media)
-                    box_art = game.get_best_media('box-2D')
-                    screenshot = game.get_best_media('screenshot')
-                    
-                    result = {
-                        'name': game.name,
-                        'platform': platform,
-                        'found': True,
-                        'media_count': media_count,
-                        'has_box_art': box_art is not None,
-                        'has_screenshot': screenshot is not None,
-                        'publisher': game.publisher,
-                        'year': game.release_date
-                    }
-                    
-                    print(f"      Media items: {media_count}")
-                    print(f"      Box art: {'✓' if box_art else '✗'}")
-                    print(f"      Screenshot: {'✓' if screenshot else '✗'}")
-                    
-                else:
-                    result = {'name': game_name, 'platform': platform, 'found': False}
-                    print(f"    ✗ Not found")
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"    ✗ Error: {e}")
-                results.append({'name': game_name, 'platform': platform, 'error': str(e)})
+            if result.get('found'):
+                found_count += 1
+                out.append(f"    ✓ Found: {result['name']}")
+                out.append(f"      Media items: {result['media_count']}")
+                out.append(f"      Box art: {'✓' if result['box_art'] else '✗'}")
+                out.append(f"      Screenshot: {'✓' if result['screenshot'] else '✗'}")
+            elif result.get('error'):
+                out.append(f"    ✗ Error: {result['error']}")
+            else:
+                out.append(f"    ✗ Not found")
         
         # Summary
-        print(f"\nBatch Processing Summary:")
-        print(f"  Total games processed: {len(game_collection)}")
-        found_count = sum(1 for r in results if r.get('found', False))
-        print(f"  Games found: {found_count}")
-        print(f"  Success rate: {found_count/len(game_collection)*100:.1f}%")
+        out.append(f"\nBatch Processing Summary:")
+        out.append(f"  Total games processed: {len(game_collection)}")
+        out.append(f"  Games found: {found_count}")
+        out.append(f"  Success rate: {found_count/len(game_collection)*100:.1f}%")
         
         # Show detailed results
-        print(f"\nDetailed Results:")
+        out.append(f"\nDetailed Results:")
         for result in results:
             if result.get('found'):
-                print(f"  ✓ {result['name']} ({result['platform'].upper()})")
-                print(f"    Publisher: {result.get('publisher', 'Unknown')}")
-                print(f"    Year: {result.get('year', 'Unknown')}")
-                print(f"    Media: {result.get('media_count', 0)} items")
+                out.append(f"  ✓ {result['name']} ({result['platform'].upper()})")
+                out.append(f"    Publisher: {result.get('publisher', 'Unknown')}")
+                out.append(f"    Year: {result.get('year', 'Unknown')}")
+                out.append(f"    Media: {result.get('media_count', 0)} items")
+                if result['box_art']:
+                    out.append(f"    Box art: {result['box_art'].format} ({result['box_art'].region})")
             elif result.get('error'):
-                print(f"  ✗ {result['name']} - Error: {result['error']}")
+                out.append(f"  ✗ {result['name']} - Error: {result['error']}")
             else:
-                print(f"  ✗ {result['name']} - Not found")
+                out.append(f"  ✗ {result['name']} - Not found")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
                 
     except Exception as e:
         print(f"✗ Error: {e}")
+        return False
+    
+    return True
 
 
 def main():
     """Run all examples."""
+    examples = (
+        example_1_basic_search,
+        example_2_search_by_id,
+        example_3_media_operations,
+        example_4_platform_support,
+        example_5_error_handling,
+        example_6_convenience_functions,
+        example_7_batch_processing_simulation,
+    )
+    
+    parser = argparse.ArgumentParser(description="Run the ScreenScraper.fr library examples.")
+    parser.add_argument('--only', type=int, metavar='N', choices=range(1, len(examples) + 1),
+                        help=f"run only example N (1-{len(examples)})")
+    args = parser.parse_args()
+    
     print("ScreenScraper.fr Python Library - Examples and Tests")
     print("=" * 60)
     
@@ -459,41 +490,70 @@ def main():
     print("  - SCREENSCRAPER_USER_PASSWORD (optional)")
     
     # Check credentials first
-    if not get_credentials():
+    credentials = get_credentials()
+    if not credentials:
         return
     
+    # Import the library (adjust import based on your setup). This is deferred
+    # until here so --help and missing credentials don't pay for loading it.
+    try:
+        from screenscraper import ScreenScraperClient
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        print("Please ensure the screenscraper.py file is in your Python path")
+        sys.exit(1)
+    
+    # One client and one pooled, retrying session serve every example, so
+    # connections are kept alive across all of their API calls
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    client = ScreenScraperClient(
+        dev_id=credentials.dev_id,
+        dev_password=credentials.dev_password,
+        user_id=credentials.user_id,
+        user_password=credentials.user_password,
+        software_name="ScreenScraperPython Examples",
+        cache_path=CACHE_PATH,
+        session=session
+    )
+    
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    
     # Run examples
-    examples = [
-        example_1_basic_search,
-        example_2_search_by_id,
-        example_3_media_operations,
-        example_4_platform_support,
-        example_5_error_handling,
-        example_6_convenience_functions,
-        example_7_batch_processing_simulation,
-    ]
+    selected = list(enumerate(examples, 1))
+    if args.only:
+        selected = [selected[args.only - 1]]
     
-    for i, example_func in enumerate(examples, 1):
-        try:
-            example_func()
-        except KeyboardInterrupt:
-            print(f"\n\nInterrupted during example {i}")
-            break
-        except Exception as e:
-            print(f"\n✗ Unexpected error in example {i}: {e}")
+    # Each example reports its own errors and returns False if it failed
+    try:
+        for i, example_func in selected:
+            if not example_func(client):
+                print(f"\n✗ Example {i} did not complete")
+    except KeyboardInterrupt:
+        print(f"\n\nInterrupted during example {i}")
+    finally:
+        session.close()
     
     print(f"\n" + "="*60)
     print("Examples completed!")
     print("\nNext steps:")
     print("1. Modify these examples for your specific use case")
     print("2. Implement proper error handling for production use")
-    print("3. Add caching to avoid repeated API calls")
+    print(f"3. Delete {CACHE_PATH} to fetch fresh data from the API")
     print("4. Consider contributing to the ScreenScraper database")
     
     # Cleanup
-    temp_dir = Path('./temp_downloads')
-    if temp_dir.exists():
-        print(f"\nNote: Sample downloads are in {temp_dir}")
+    if any(TEMP_DIR.iterdir()):
+        print(f"\nNote: Sample downloads are in {TEMP_DIR}")
 
 
 if __name__ == "__main__":
@@ -40,6 +40,15 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8",
+            "aiofiles>=0.8",
+            "uvloop>=0.18; sys_platform != 'win32'",
+        ],
+        "speedups": [
+            "orjson>=3.6",
+            "ijson>=3.1",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov",
@@ -64,25 +73,3 @@ setup(
         "ScreenScraper.fr": "https://www.screenscraper.fr/",
     },
 )
-
-# Additional files to include in distribution
-MANIFEST = """
-include README.md
-include LICENSE
-include requirements.txt
-include examples.py
-recursive-include examples *.py
-recursive-include docs *.md *.rst
-"""
-
-# Write MANIFEST.in file
-manifest_file = Path(__file__).parent / "MANIFEST.in"
-manifest_file.write_text(MANIFEST.strip())
-
-print("Setup configuration created!")
-print("\nTo install the package locally for development:")
-print("  pip install -e .")
-print("\nTo install with development dependencies:")
-print("  pip install -e .[dev]")
-print("\nTo build distribution packages:")
-print("  python setup.py sdist bdist_wheel")